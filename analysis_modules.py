@@ -3,6 +3,7 @@ import re
 import pandas as pd
 import geopandas as gpd
 import numpy as np
+import shapely
 from datetime import datetime
 import multiprocessing as mp
 from config import (
@@ -26,14 +27,18 @@ from config import (
 # ---------------------------
 def min_max_normalize(series, outlier_percentile=5):
     """Normalize a pandas Series to range [0,1], omitting outliers."""
-    s = series.fillna(0).astype(float)
-    lower = s.quantile(outlier_percentile / 100)
-    upper = s.quantile(1 - outlier_percentile / 100)
-    
+    arr = series.fillna(0).to_numpy(dtype=np.float64)
+    p = outlier_percentile / 100
+    # Both quantiles from a single pass over the array
+    lower, upper = np.quantile(arr, [p, 1 - p])
+
     if upper - lower == 0:
-        return s.apply(lambda x: 0.0 if upper == 0 else 1.0)
-    
-    return (s.clip(lower=lower, upper=upper) - lower) / (upper - lower)
+        return pd.Series(np.full(len(arr), 0.0 if upper == 0 else 1.0), index=series.index)
+
+    np.clip(arr, lower, upper, out=arr)
+    arr -= lower
+    arr /= (upper - lower)
+    return pd.Series(arr, index=series.index)
 
 def compute_index_for_factor_high(gdf, factor_name, config):
     info = config.DATASET_INFO[factor_name]
@@ -53,38 +58,44 @@ def ensure_crs_vector(gdf, target_crs):
 
 def ensure_crs_raster(raster_path, target_crs, resolution):
     import rasterio
-    from rasterio.warp import calculate_default_transform, reproject, Resampling
+    import rasterio.shutil
+    from rasterio.warp import calculate_default_transform, Resampling
+    from rasterio.vrt import WarpedVRT
     from pathlib import Path
     raster_path = Path(raster_path)
     with rasterio.open(raster_path) as src:
         same_crs = (src.crs is not None and src.crs.to_string() == target_crs)
         same_res = np.isclose(src.res[0], resolution, atol=0.1)
         if not same_crs or not same_res:
-            print("Reprojecting raster:", raster_path.name)
+            # Describe the warp in a small .vrt instead of materializing a
+            # full reprojected GeoTIFF: readers warp lazily, window by
+            # window, and workers can open the .vrt path like any raster.
+            print("Warping raster lazily:", raster_path.name)
             transform, width, height = calculate_default_transform(
                 src.crs, target_crs, src.width, src.height, *src.bounds, resolution=resolution
             )
-            profile = src.meta.copy()
-            profile.update({'crs': target_crs, 'transform': transform, 'width': width, 'height': height})
-            temp_path = raster_path.parent / f"reprojected_{raster_path.name}"
-            with rasterio.open(temp_path, 'w', **profile) as dst:
-                for i in range(1, src.count + 1):
-                    reproject(
-                        source=rasterio.band(src, i),
-                        destination=rasterio.band(dst, i),
-                        src_transform=src.transform,
-                        src_crs=src.crs,
-                        dst_transform=transform,
-                        dst_crs=target_crs,
-                        resampling=Resampling.bilinear
-                    )
-            return str(temp_path)
+            vrt_path = raster_path.parent / f"warped_{raster_path.stem}.vrt"
+            # CHECK_WITH_INVERT_PROJ=NO sidesteps the PROJ>=6 inverse-check
+            # slowdown; num_threads lets GDAL partition the warp across cores
+            # whenever the VRT is actually read.
+            with rasterio.Env(CHECK_WITH_INVERT_PROJ="NO", GDAL_NUM_THREADS="ALL_CPUS", GDAL_CACHEMAX=512):
+                with WarpedVRT(src, crs=target_crs, transform=transform, width=width,
+                               height=height, resampling=Resampling.bilinear,
+                               warp_mem_limit=512, num_threads=os.cpu_count()) as vrt:
+                    rasterio.shutil.copy(vrt, vrt_path, driver="VRT")
+            return str(vrt_path)
         else:
             return str(raster_path)
 
 # ---------------------------
 # Capital Projects Processing
 # ---------------------------
+# Precompiled TotalFundi patterns (compiled once, shared by the scalar and
+# Series parsers below)
+_RE_BETWEEN = re.compile(r"Between \$(\d+(?:\.\d+)?) million and \$(\d+(?:\.\d+)?) million", re.IGNORECASE)
+_RE_LTGT = re.compile(r"(?:Less than|Greater than) \$(\d+(?:\.\d+)?) million", re.IGNORECASE)
+_RE_DOLLAR = re.compile(r"\$(.*)")
+
 def reformat_est_investment(value):
     """
     Convert a TotalFundi string value into a numeric value.
@@ -98,19 +109,19 @@ def reformat_est_investment(value):
         return np.nan
     value = value.strip()
     # Handle 'Between $3 million and $5 million'
-    between_match = re.match(r"Between \$(\d+(?:\.\d+)?) million and \$(\d+(?:\.\d+)?) million", value, re.IGNORECASE)
+    between_match = _RE_BETWEEN.match(value)
     if between_match:
         low = float(between_match.group(1))
         high = float(between_match.group(2))
         mid = (low + high) / 2
         return mid * 1e6
     # Handle 'Less than $1 million' or 'Greater than $10 million'
-    lt_gt_match = re.match(r"(Less than|Greater than) \$(\d+(?:\.\d+)?) million", value, re.IGNORECASE)
+    lt_gt_match = _RE_LTGT.match(value)
     if lt_gt_match:
-        num = float(lt_gt_match.group(2))
+        num = float(lt_gt_match.group(1))
         return num * 1e6
     # Handle standard dollar amounts like "$2,972,000"
-    standard_match = re.match(r"\$(.*)", value)
+    standard_match = _RE_DOLLAR.match(value)
     if standard_match:
         num_str = standard_match.group(1).replace(",", "")
         try:
@@ -119,6 +130,26 @@ def reformat_est_investment(value):
             return np.nan
     return np.nan
 
+def reformat_est_investment_series(s):
+    """
+    Vectorized version of reformat_est_investment for a whole TotalFundi
+    Series: each pattern is applied once via the str accessor instead of
+    row-by-row through .apply().
+    """
+    s = s.str.strip()
+    # 'Between $X million and $Y million' -> midpoint
+    between = s.str.extract(_RE_BETWEEN).astype(float)
+    result = (between[0] + between[1]) / 2 * 1e6
+    # 'Less than $X million' / 'Greater than $X million'
+    lt_gt = s.str.extract(_RE_LTGT).astype(float)[0] * 1e6
+    result = result.combine_first(lt_gt)
+    # Standard dollar amounts like "$2,972,000"
+    dollar = pd.to_numeric(
+        s.str.extract(_RE_DOLLAR)[0].str.replace(",", "", regex=False),
+        errors="coerce"
+    )
+    return result.combine_first(dollar)
+
 def process_capital_projects(cap_gdf, config):
     """
     For CapitalProjects:
@@ -127,9 +158,12 @@ def process_capital_projects(cap_gdf, config):
       - Reformat TotalFundi into a numeric EstInvestment.
     """
     cap_gdf = cap_gdf[cap_gdf["CurrentPha"].str.lower() == "completed"].copy()
-    cap_gdf["Construc_4_dt"] = pd.to_datetime(cap_gdf["Construc_4"], format="%m/%d/%Y %I:%M:%S %p", errors='coerce')
-    cap_gdf = cap_gdf[cap_gdf["Construc_4_dt"] >= config.CUTOFF_DATE].copy()
-    cap_gdf["EstInvestment"] = cap_gdf["TotalFundi"].apply(reformat_est_investment)
+    # cache=True skips re-parsing duplicate strings (milestone dates cluster),
+    # and comparing in numpy avoids building an intermediate boolean Series.
+    cap_gdf["Construc_4_dt"] = pd.to_datetime(cap_gdf["Construc_4"], format="%m/%d/%Y %I:%M:%S %p", errors='coerce', cache=True)
+    mask = cap_gdf["Construc_4_dt"].to_numpy() >= np.datetime64(config.CUTOFF_DATE)
+    cap_gdf = cap_gdf.loc[mask].copy()
+    cap_gdf["EstInvestment"] = reformat_est_investment_series(cap_gdf["TotalFundi"])
     return cap_gdf
 
 def allocate_investment_by_tracker(cap_gdf, parks_gdf):
@@ -138,19 +172,16 @@ def allocate_investment_by_tracker(cap_gdf, parks_gdf):
     allocate the total EstInvestment proportionally to each park based on its 'acres'.
     This is achieved by first performing a spatial join between CapitalProjects and Parks.
     """
-    # Spatial join: assign each capital project point the attributes (including acres) from intersecting parks
-    cap_joined = gpd.sjoin(cap_gdf, parks_gdf[["globalid", "acres", "geometry"]], how="left", predicate="intersects")
-    allocation = []
-    for tracker, group in cap_joined.groupby("TrackerID"):
-        total_investment = group["EstInvestment"].iloc[0]  # same total for each site
-        total_acres = group["acres"].sum()
-        for idx, row in group.iterrows():
-            prop = row["acres"] / total_acres if total_acres > 0 else 0
-            allocated = total_investment * prop
-            row["EstInvestment"] = allocated
-            allocation.append(row)
-    allocated_gdf = gpd.GeoDataFrame(allocation, crs=parks_gdf.crs)
-    return allocated_gdf
+    # Spatial join: assign each capital project point the attributes (including acres) from intersecting parks.
+    # The caller passes a frame restricted to the join columns; joining it
+    # as-is (rather than reslicing here) keeps its materialized sindex valid.
+    cap_joined = gpd.sjoin(cap_gdf, parks_gdf, how="left", predicate="intersects")
+    # Each site of a tracker carries the same project total, so the per-site
+    # share is simply acres / total tracker acres, computed in one pass.
+    total_acres = cap_joined.groupby("TrackerID")["acres"].transform("sum")
+    prop = np.where(total_acres > 0, cap_joined["acres"] / total_acres, 0.0)
+    cap_joined["EstInvestment"] = cap_joined["EstInvestment"] * prop
+    return cap_joined
 
 def aggregate_cap_proj_to_parks(parks_gdf, cap_joined, config):
     """
@@ -158,9 +189,14 @@ def aggregate_cap_proj_to_parks(parks_gdf, cap_joined, config):
     Concatenate text fields (separated by ", ") and sum the EstInvestment values (stored as EstInvTotal).
     """
     concat_fields = config.DATASET_INFO["CapitalProjects"]["concat_fields"]
-    agg_dict = {field: lambda x: ", ".join(x.astype(str)) for field in concat_fields if field != "EstInvestment"}
-    agg_dict["EstInvestment"] = "sum"
-    cap_agg = cap_joined.groupby("index_right").agg(agg_dict).reset_index()
+    text_fields = [field for field in concat_fields if field != "EstInvestment"]
+    # Cast the text fields to str once up front so the groupby can use the
+    # plain ", ".join aggregator instead of a per-group lambda; the
+    # EstInvestment sum stays on the cython fast path.
+    grouped = cap_joined.astype({field: str for field in text_fields}).groupby("index_right")
+    cap_agg = grouped[text_fields].agg(", ".join)
+    cap_agg["EstInvestment"] = grouped["EstInvestment"].sum()
+    cap_agg = cap_agg.reset_index()
     cap_agg = cap_agg.rename(columns={"EstInvestment": config.DATASET_INFO["CapitalProjects"]["est_total_field"]})
     parks_gdf = parks_gdf.reset_index().rename(columns={"index": "park_index"})
     merged = parks_gdf.merge(cap_agg, left_on="park_index", right_on="index_right", how="left")
@@ -177,78 +213,80 @@ def aggregate_cap_proj_to_parks(parks_gdf, cap_joined, config):
 def kelvin_to_fahrenheit(K):
     return (K - 273.15) * 9/5 + 32
 
+def kelvin_to_fahrenheit_inplace(K):
+    """In-place float32 version for large arrays: no float64 upcast and no
+    temporaries, so the conversion touches half the bytes."""
+    K = K.astype(np.float32, copy=False)
+    K -= np.float32(273.15)
+    K *= np.float32(9 / 5)
+    K += np.float32(32)
+    return K
+
 def load_raster_distribution_f(raster_path):
+    """
+    Summarize the raster's Fahrenheit distribution as (bin_edges, cdf).
+    A 4096-bin histogram CDF resolves percentiles well past the 2-decimal
+    precision used downstream and avoids sorting every valid pixel.
+    """
     import rasterio
     with rasterio.open(raster_path) as src:
         data = src.read(1, masked=True)
-    data_f = kelvin_to_fahrenheit(data)
+    data_f = kelvin_to_fahrenheit_inplace(data)
     valid = data_f.compressed()
-    sorted_values = np.sort(valid)
-    return sorted_values
+    hist, bin_edges = np.histogram(valid, bins=4096)
+    cdf = np.cumsum(hist).astype(np.float64)
+    if cdf[-1] > 0:
+        cdf /= cdf[-1]
+    return bin_edges, cdf
 
 def percentile_from_distribution(value, distribution):
-    idx = np.searchsorted(distribution, value, side='right')
-    percentile = (idx / len(distribution)) * 100.0
-    return percentile
+    # Accepts a scalar or an array of values; np.interp vectorizes either way.
+    bin_edges, cdf = distribution
+    return np.interp(value, bin_edges[1:], cdf) * 100.0
 
-def extract_mean_temperature(site, raster_path):
-    import rasterio
+def extract_mean_temperature(bounds, src):
     from rasterio.windows import Window
-    from shapely.geometry import box
-    
-    geom = site.geometry
-    if geom is None or geom.is_empty:
+
+    xmin, ymin, xmax, ymax = bounds
+    if not np.all(np.isfinite([xmin, ymin, xmax, ymax])):
+        return np.nan
+
+    # Convert bounds to pixel coordinates
+    row_start, col_start = src.index(xmin, ymax)
+    row_end, col_end = src.index(xmax, ymin)
+
+    # Ensure rows and columns are in the correct order
+    row_start, row_end = sorted([row_start, row_end])
+    col_start, col_end = sorted([col_start, col_end])
+
+    # Ensure coordinates are within raster boundaries
+    row_start = max(row_start, 0)
+    col_start = max(col_start, 0)
+    row_end = min(row_end, src.height - 1)
+    col_end = min(col_end, src.width - 1)
+
+    if row_end < row_start or col_end < col_start:
+        return np.nan
+
+    window = Window(col_start, row_start, col_end - col_start + 1, row_end - row_start + 1)
+    data = src.read(1, window=window, masked=True)
+
+    if data.size == 0:
         return np.nan
-    
-    # Change: Buffer the polygon directly instead of its centroid
-    BUFFER = 2000.0  # using a 2000 ft buffer
-    buffer_geom = geom.buffer(BUFFER)
-    
-    # Get the bounds of the buffered geometry
-    xmin, ymin, xmax, ymax = buffer_geom.bounds
-    
-    with rasterio.open(raster_path) as src:
-        # Convert bounds to pixel coordinates
-        row_start, col_start = src.index(xmin, ymax)
-        row_end, col_end = src.index(xmax, ymin)
-        
-        # Ensure rows and columns are in the correct order
-        row_start, row_end = sorted([row_start, row_end])
-        col_start, col_end = sorted([col_start, col_end])
-        
-        # Ensure coordinates are within raster boundaries
-        row_start = max(row_start, 0)
-        col_start = max(col_start, 0)
-        row_end = min(row_end, src.height - 1)
-        col_end = min(col_end, src.width - 1)
-        
-        if row_end < row_start or col_end < col_start:
-            return np.nan
-            
-        window = Window(col_start, row_start, col_end - col_start + 1, row_end - row_start + 1)
-        data = src.read(1, window=window, masked=True)
-        
-        if data.size == 0:
-            return np.nan
-            
-        data_f = kelvin_to_fahrenheit(data)
-        return float(data_f.mean())
 
-def process_site_heat(args):
-    site, raster_path = args
-    return extract_mean_temperature(site, raster_path)
+    data_f = kelvin_to_fahrenheit_inplace(data)
+    return float(data_f.mean())
 
 def compute_raw_heat(gdf, config):
-    gdf = ensure_crs_vector(gdf, config.CRS)
+    if "heat_mean" not in gdf.columns:
+        gdf = compute_raw_raster_stats(gdf, config)
     heat_raster_path = ensure_crs_raster(config.HEAT_FILE, config.CRS, config.RESOLUTION)
-    sites_list = [(row, heat_raster_path) for idx, row in gdf.iterrows()]
-    cpu_cnt = mp.cpu_count()
-    with mp.Pool(cpu_cnt - 1) as pool:
-        mean_temps = pool.map(process_site_heat, sites_list)
-    gdf["heat_mean"] = mean_temps
     distribution = load_raster_distribution_f(heat_raster_path)
-    percentiles = [percentile_from_distribution(val, distribution) if np.isfinite(val) else np.nan for val in gdf["heat_mean"]]
-    gdf["heat_index"] = [round(1 - (p / 100), 2) if np.isfinite(p) else np.nan for p in percentiles]
+    # One interpolation over the whole column instead of a Python call per park
+    temps = gdf["heat_mean"].to_numpy(dtype=float)
+    mask = np.isfinite(temps)
+    pct = np.where(mask, percentile_from_distribution(temps, distribution), np.nan)
+    gdf["heat_index"] = np.round(np.where(mask, 1 - pct / 100.0, np.nan), 2)
     return gdf
 
 def compute_heat_index(gdf, config):
@@ -263,81 +301,151 @@ def compute_heat_index(gdf, config):
 # ---------------------------
 COAST_VALUES = {1: '500', 2: '100'}
 STORM_VALUES = {1: 'Shl', 2: 'Dp', 3: 'Tid'}
+FLOOD_COMPONENTS = ['Cst_500_nr', 'Cst_100_nr', 'StrmShl_nr', 'StrmDp_nr', 'StrmTid_nr']
 
-def read_raster_window(raster_path, bbox, target_crs):
+# Per-worker raster handles, set by _init_raster_worker so each pool process
+# opens the rasters it needs once instead of once per site.
+_HEAT_SRC = None
+_FEMA_SRC = None
+_STORM_SRC = None
+
+def _init_raster_worker(heat_path, fema_path, storm_path):
+    global _HEAT_SRC, _FEMA_SRC, _STORM_SRC
     import rasterio
-    with rasterio.open(raster_path) as src:
-        if src.crs is not None and src.crs.to_string() != target_crs:
-            raise ValueError(f"Raster {raster_path} CRS ({src.crs}) does not match {target_crs}.")
-        window = src.window(*bbox)
-        data = src.read(1, window=window, masked=False)
-        transform = src.window_transform(window)
-        return data, transform
+    _HEAT_SRC = rasterio.open(heat_path, sharing=False) if heat_path else None
+    _FEMA_SRC = rasterio.open(fema_path, sharing=False) if fema_path else None
+    _STORM_SRC = rasterio.open(storm_path, sharing=False) if storm_path else None
+
+# Lazily created persistent pool so repeated raster passes reuse the
+# workers (and their open raster handles) instead of respawning.
+_RASTER_POOL = None
+_RASTER_POOL_KEY = None
+
+def _get_raster_pool(heat_path, fema_path, storm_path, max_workers):
+    global _RASTER_POOL, _RASTER_POOL_KEY
+    from concurrent.futures import ProcessPoolExecutor
+    key = (heat_path, fema_path, storm_path)
+    if _RASTER_POOL is None or _RASTER_POOL_KEY != key:
+        if _RASTER_POOL is not None:
+            _RASTER_POOL.shutdown()
+        _RASTER_POOL = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_raster_worker,
+            initargs=(heat_path, fema_path, storm_path)
+        )
+        _RASTER_POOL_KEY = key
+    return _RASTER_POOL
+
+def read_raster_window(src, bbox, target_crs):
+    if src.crs is not None and src.crs.to_string() != target_crs:
+        raise ValueError(f"Raster {src.name} CRS ({src.crs}) does not match {target_crs}.")
+    window = src.window(*bbox)
+    data = src.read(1, window=window, masked=False)
+    transform = src.window_transform(window)
+    return data, transform
 
 def process_site_flood(args):
-    idx, site, fema_path, storm_path, buffer_dist, target_crs = args
-    from shapely.geometry import box
-    geom = site.geometry
-    if geom is None or geom.is_empty:
-        return idx, {
-            'Cst_500_nr': 0.0, 'Cst_100_nr': 0.0,
-            'StrmShl_nr': 0.0, 'StrmDp_nr': 0.0, 'StrmTid_nr': 0.0
-        }
-    # Change: Buffer the polygon directly instead of its centroid
-    buffer_geom = geom.buffer(buffer_dist)
+    idx, buffer_wkb, target_crs = args
+    buffer_geom = shapely.from_wkb(buffer_wkb) if buffer_wkb is not None else None
+    if buffer_geom is None or buffer_geom.is_empty:
+        return idx, dict.fromkeys(FLOOD_COMPONENTS, 0.0)
     minx, miny, maxx, maxy = buffer_geom.bounds
     bbox = (minx, miny, maxx, maxy)
     try:
-        fema_arr, fema_transform = read_raster_window(fema_path, bbox, target_crs)
-        storm_arr, _ = read_raster_window(storm_path, bbox, target_crs)
+        fema_arr, fema_transform = read_raster_window(_FEMA_SRC, bbox, target_crs)
+        storm_arr, _ = read_raster_window(_STORM_SRC, bbox, target_crs)
     except Exception as e:
-        return idx, {
-            'Cst_500_nr': 0.0, 'Cst_100_nr': 0.0,
-            'StrmShl_nr': 0.0, 'StrmDp_nr': 0.0, 'StrmTid_nr': 0.0
-        }
+        return idx, dict.fromkeys(FLOOD_COMPONENTS, 0.0)
     min_height = min(fema_arr.shape[0], storm_arr.shape[0])
     min_width = min(fema_arr.shape[1], storm_arr.shape[1])
-    fema_arr = fema_arr[:min_height, :min_width]
-    storm_arr = storm_arr[:min_height, :min_width]
+    # Both rasters hold small category codes (0..3); pinning them to uint8
+    # keeps the masked selection and bincount below on the narrow fast path.
+    # Only an already-byte-sized band may be cast directly: float bands with
+    # NaN nodata or wider integer codes must be squashed to the known codes
+    # first, or the cast would be undefined / wrap mod 256 into classes 1-3.
+    def _as_codes(arr):
+        if arr.dtype == np.uint8:
+            return arr
+        return np.where(np.isin(arr, (1, 2, 3)), arr, 0).astype(np.uint8)
+
+    fema_arr = _as_codes(fema_arr[:min_height, :min_width])
+    storm_arr = _as_codes(storm_arr[:min_height, :min_width])
     height, width = fema_arr.shape
     from rasterio import features
-    site_rast = features.rasterize([(geom, 1)], out_shape=(height, width),
-                                    transform=fema_transform, fill=0, dtype=np.uint8)
     buffer_rast = features.rasterize([(buffer_geom, 1)], out_shape=(height, width),
                                       transform=fema_transform, fill=0, dtype=np.uint8)
     buffer_mask = (buffer_rast == 1)
     results = {}
+    denom = buffer_mask.sum()
+    if denom:
+        # One pass per raster: count every category at once instead of
+        # re-scanning the window for each of the five flood values. With
+        # uint8 input no sign filtering is needed before the bincount.
+        fema_counts = np.bincount(fema_arr[buffer_mask], minlength=3)
+        storm_counts = np.bincount(storm_arr[buffer_mask], minlength=4)
+    else:
+        fema_counts = np.zeros(3, dtype=np.intp)
+        storm_counts = np.zeros(4, dtype=np.intp)
     for cval, ctag in COAST_VALUES.items():
-        nr_match = ((buffer_mask) & (fema_arr == cval)).sum() if buffer_mask.sum() > 0 else 0
-        results[f"Cst_{ctag}_nr"] = nr_match / buffer_mask.sum() if buffer_mask.sum() else 0.0
+        results[f"Cst_{ctag}_nr"] = fema_counts[cval] / denom if denom else 0.0
     for sval, stag in STORM_VALUES.items():
-        nr_match = ((buffer_mask) & (storm_arr == sval)).sum() if buffer_mask.sum() > 0 else 0
-        results[f"Strm{stag}_nr"] = nr_match / buffer_mask.sum() if buffer_mask.sum() else 0.0
+        results[f"Strm{stag}_nr"] = storm_counts[sval] / denom if denom else 0.0
     return idx, results
 
+def process_site_all(args):
+    """Fused per-site kernel: heat mean plus all five flood components."""
+    idx, bounds, buffer_wkb, target_crs = args
+    stats = {"heat_mean": extract_mean_temperature(bounds, _HEAT_SRC) if _HEAT_SRC is not None else np.nan}
+    _, flood_stats = process_site_flood((idx, buffer_wkb, target_crs))
+    stats.update(flood_stats)
+    return idx, stats
+
+def compute_raw_raster_stats(gdf, config):
+    """
+    Compute heat_mean and the five flood components in one pool pass: the
+    parks are buffered once, shipped to the workers once, and each worker
+    reads all three rasters through its persistent handles.
+    """
+    gdf = ensure_crs_vector(gdf, config.CRS)
+    heat_raster_path = ensure_crs_raster(config.HEAT_FILE, config.CRS, config.RESOLUTION)
+    buffered = gdf.geometry.buffer(config.ANALYSIS_BUFFER_FT)
+    bounds = buffered.bounds.to_numpy()
+    buffer_wkbs = shapely.to_wkb(buffered.values)
+    args_list = [
+        (idx, tuple(b), wkb, config.CRS)
+        for idx, b, wkb in zip(gdf.index, bounds, buffer_wkbs)
+    ]
+    cpu_cnt = max(1, mp.cpu_count() - 1)
+    pool = _get_raster_pool(heat_raster_path, config.FEMA_RASTER, config.STORM_RASTER, cpu_cnt)
+    results = dict(pool.map(process_site_all, args_list, chunksize=64))
+    results_df = pd.DataFrame.from_dict(results, orient='index')
+    stat_cols = ["heat_mean"] + FLOOD_COMPONENTS
+    gdf = gdf.drop(columns=stat_cols, errors='ignore')
+    gdf = gdf.join(results_df[stat_cols])
+    return gdf
+
 def compute_raw_flood(gdf, config):
     gdf = ensure_crs_vector(gdf, config.CRS)
     buffer_dist = config.ANALYSIS_BUFFER_FT
     fema_raster = config.FEMA_RASTER
     storm_raster = config.STORM_RASTER
+    # Buffer once in the parent and ship each worker the WKB bytes only
+    buffer_wkbs = shapely.to_wkb(gdf.geometry.buffer(buffer_dist).values)
     args_list = [
-        (idx, row, fema_raster, storm_raster, buffer_dist, config.CRS)
-        for idx, row in gdf.iterrows()
+        (idx, wkb, config.CRS)
+        for idx, wkb in zip(gdf.index, buffer_wkbs)
     ]
-    from concurrent.futures import ProcessPoolExecutor
     cpu_cnt = max(1, mp.cpu_count() - 1)
-    with ProcessPoolExecutor(max_workers=cpu_cnt) as executor:
-        results = list(executor.map(process_site_flood, args_list))
+    pool = _get_raster_pool(None, fema_raster, storm_raster, cpu_cnt)
+    results = list(pool.map(process_site_flood, args_list, chunksize=64))
     results_dict = {idx: res for idx, res in results}
     results_df = pd.DataFrame.from_dict(results_dict, orient='index')
-    flood_components = ['Cst_500_nr', 'Cst_100_nr', 'StrmShl_nr', 'StrmDp_nr', 'StrmTid_nr']
-    gdf = gdf.drop(columns=flood_components, errors='ignore')
-    gdf = gdf.join(results_df[flood_components])
+    gdf = gdf.drop(columns=FLOOD_COMPONENTS, errors='ignore')
+    gdf = gdf.join(results_df[FLOOD_COMPONENTS])
     return gdf
 
 def compute_flood_hazard_indices(gdf, config, coastal_weights=None, stormwater_weights=None):
-    flood_components = ['Cst_500_nr', 'Cst_100_nr', 'StrmShl_nr', 'StrmDp_nr', 'StrmTid_nr']
-    if not all(comp in gdf.columns for comp in flood_components):
+    if not all(comp in gdf.columns for comp in FLOOD_COMPONENTS):
         gdf = compute_raw_flood(gdf, config)
     if coastal_weights is None:
         coastal_weights = {'Cst_500_nr': 0.15, 'Cst_100_nr': 0.35, 'StrmTid_nr': 0.5}
@@ -361,42 +469,90 @@ def compute_flood_hazard_indices(gdf, config, coastal_weights=None, stormwater_w
 # ---------------------------
 # Vulnerability Analysis Functions
 # ---------------------------
+# Vector inputs (HVI/FVI) keyed by (path, crs): read once per run through
+# pyogrio, reprojected, and with the spatial index already materialized.
+_VECTOR_CACHE = {}
+
+def _load_vector(path, target_crs):
+    key = (path, target_crs)
+    if key not in _VECTOR_CACHE:
+        gdf = gpd.read_file(path, engine="pyogrio")
+        gdf = ensure_crs_vector(gdf, target_crs)
+        _ = gdf.sindex
+        _VECTOR_CACHE[key] = gdf
+    return _VECTOR_CACHE[key]
+
 def area_weighted_average(buffer_geom, features_gdf, field_name):
-    total_area = 0.0
-    weighted_sum = 0.0
-    for idx, row in features_gdf.iterrows():
-        geom = row.geometry
-        if geom is None or geom.is_empty:
-            continue
-        intersection = buffer_geom.intersection(geom)
-        if not intersection.is_empty:
-            area = intersection.area
-            try:
-                value = float(row.get(field_name, 0))
-            except (ValueError, TypeError):
-                continue
-            weighted_sum += value * area
-            total_area += area
-    return weighted_sum / total_area if total_area > 0 else float('nan')
+    geoms = features_gdf.geometry.values
+    if len(geoms) == 0:
+        return float('nan')
+    col = features_gdf.get(field_name)
+    if col is None:
+        values = np.zeros(len(geoms), dtype=float)
+    else:
+        values = pd.to_numeric(col, errors="coerce").to_numpy(dtype=float)
+    # Intersection and area as shapely 2.0 ufuncs: one C call over the
+    # candidate array instead of a Python loop per feature. Features with
+    # non-numeric values are excluded from both sums, as before.
+    # Features wholly inside the buffer skip the intersection entirely:
+    # a prepared contains test is near-constant time, and fully-contained
+    # polygons (small tracts inside the 2000 ft buffer) are the common case.
+    shapely.prepare(buffer_geom)
+    # Missing/empty geometries contribute nothing (the old loop skipped
+    # them); keep them out of the boundary branch so intersection never
+    # sees a None and NaN-poisons total_area.
+    usable = ~(shapely.is_missing(geoms) | shapely.is_empty(geoms))
+    contained = shapely.contains(buffer_geom, geoms)
+    areas = np.zeros(len(geoms), dtype=float)
+    areas[contained] = shapely.area(geoms[contained])
+    boundary = usable & ~contained
+    areas[boundary] = shapely.area(shapely.intersection(buffer_geom, geoms[boundary]))
+    areas = np.where(np.isfinite(values), areas, 0.0)
+    total_area = areas.sum()
+    if total_area <= 0:
+        return float('nan')
+    return np.nansum(values * areas) / total_area
+
+def _bulk_area_weighted_average(buffers, features_gdf, field_names):
+    """
+    Area-weighted average of one or more fields around each buffer geometry,
+    computed with a single bulk spatial-index query and bincount aggregation
+    instead of a per-site loop. Returns a dict of field -> float array
+    aligned with `buffers` (NaN where nothing overlaps).
+    """
+    if isinstance(field_names, str):
+        field_names = [field_names]
+    n = len(buffers)
+    out = {f: np.full(n, np.nan) for f in field_names}
+    if n == 0 or len(features_gdf) == 0:
+        return out
+    left_idx, right_idx = features_gdf.sindex.query(buffers, predicate="intersects")
+    if len(left_idx) == 0:
+        return out
+    feat_geoms = features_gdf.geometry.values[right_idx]
+    # Same contains fast path as area_weighted_average: pairs where the
+    # buffer wholly contains the feature take the feature's own area and
+    # skip the much costlier GEOS intersection.
+    contained = shapely.contains(buffers[left_idx], feat_geoms)
+    areas = np.empty(len(feat_geoms), dtype=float)
+    areas[contained] = shapely.area(feat_geoms[contained])
+    boundary = ~contained
+    areas[boundary] = shapely.area(shapely.intersection(buffers[left_idx][boundary], feat_geoms[boundary]))
+    for f in field_names:
+        values = pd.to_numeric(features_gdf[f], errors="coerce").to_numpy(dtype=float)[right_idx]
+        f_areas = np.where(np.isfinite(values), areas, 0.0)
+        num = np.bincount(left_idx, weights=np.nan_to_num(values) * f_areas, minlength=n)
+        den = np.bincount(left_idx, weights=f_areas, minlength=n)
+        np.divide(num, den, out=out[f], where=den > 0)
+    return out
 
 def compute_raw_heat_vulnerability(gdf, config):
     gdf = ensure_crs_vector(gdf, config.CRS)
     buffer_dist = config.ANALYSIS_BUFFER_FT
-    hvi = gpd.read_file(config.HVI_DATA)
-    hvi = ensure_crs_vector(hvi, config.CRS)
-    hvi_sindex = hvi.sindex
-    hvi_values = []
-    for idx, site in gdf.iterrows():
-        geom = site.geometry
-        if geom is None or geom.is_empty:
-            hvi_values.append(np.nan)
-            continue
-        buffer_geom = geom.buffer(buffer_dist)
-        possible_hvi = hvi.iloc[list(hvi_sindex.intersection(buffer_geom.bounds))]
-        hvi_val = area_weighted_average(buffer_geom, possible_hvi, "HVI")
-        hvi_values.append(hvi_val)
+    hvi = _load_vector(config.HVI_DATA, config.CRS)
+    buffers = gdf.geometry.buffer(buffer_dist).values
     raw_field = config.DATASET_INFO["Heat_Vulnerability_Index"].get("raw", "hvi_area")
-    gdf[raw_field] = hvi_values
+    gdf[raw_field] = _bulk_area_weighted_average(buffers, hvi, "HVI")["HVI"]
     return gdf
 
 def compute_heat_vulnerability_index(gdf, config):
@@ -409,25 +565,11 @@ def compute_heat_vulnerability_index(gdf, config):
 def compute_raw_flood_vulnerability(gdf, config):
     gdf = ensure_crs_vector(gdf, config.CRS)
     buffer_dist = config.ANALYSIS_BUFFER_FT
-    fvi = gpd.read_file(config.FVI_DATA)
-    fvi = ensure_crs_vector(fvi, config.CRS)
-    fvi_sindex = fvi.sindex
-    ss80_values = []
-    tid80_values = []
-    for idx, site in gdf.iterrows():
-        geom = site.geometry
-        if geom is None or geom.is_empty:
-            ss80_values.append(np.nan)
-            tid80_values.append(np.nan)
-            continue
-        buffer_geom = geom.buffer(buffer_dist)
-        possible_fvi = fvi.iloc[list(fvi_sindex.intersection(buffer_geom.bounds))]
-        ss80_val = area_weighted_average(buffer_geom, possible_fvi, "ss_80s")
-        tid80_val = area_weighted_average(buffer_geom, possible_fvi, "tid_80s")
-        ss80_values.append(ss80_val)
-        tid80_values.append(tid80_val)
-    gdf["ssvul_area"] = ss80_values
-    gdf["tivul_area"] = tid80_values
+    fvi = _load_vector(config.FVI_DATA, config.CRS)
+    buffers = gdf.geometry.buffer(buffer_dist).values
+    averages = _bulk_area_weighted_average(buffers, fvi, ["ss_80s", "tid_80s"])
+    gdf["ssvul_area"] = averages["ss_80s"]
+    gdf["tivul_area"] = averages["tid_80s"]
     flood_raw_field = config.DATASET_INFO["Flood_Vulnerability_Index"].get("raw", "flood_vuln")
     gdf[flood_raw_field] = gdf[["ssvul_area", "tivul_area"]].mean(axis=1)
     return gdf
@@ -452,18 +594,25 @@ def run_analysis():
     import config  # import config to pass as module
     cap_projects = process_capital_projects(cap_projects, config)
     
+    # Slice the parks join columns once and materialize the spatial index so
+    # both sjoins below reuse the same STRtree instead of rebuilding it.
+    parks_join = parks[["globalid", "acres", "geometry"]]
+    _ = parks_join.sindex
+
     # Allocate multi-site project funding using park acres
-    cap_projects_alloc = allocate_investment_by_tracker(cap_projects, parks)
-    
+    cap_projects_alloc = allocate_investment_by_tracker(cap_projects, parks_join)
+
     # Spatial join (intersection)
     if "index_right" in cap_projects_alloc.columns:
         cap_projects_alloc = cap_projects_alloc.drop(columns=["index_right"])
-    cap_joined = gpd.sjoin(cap_projects_alloc, parks[['acres', 'globalid', 'geometry']], how="left", predicate="intersects")
+    cap_joined = gpd.sjoin(cap_projects_alloc, parks_join, how="left", predicate="intersects")
     
     # Aggregate capital project fields to each park
     parks_agg = aggregate_cap_proj_to_parks(parks, cap_joined, config)
     
-    # Compute raster‐based indices on parks_agg
+    # Compute raster‐based indices on parks_agg: one fused pool pass pulls
+    # the heat and flood stats, then the index wrappers work from columns.
+    parks_agg = compute_raw_raster_stats(parks_agg, config)
     parks_agg = compute_heat_index(parks_agg, config)
     parks_agg = compute_flood_hazard_indices(parks_agg, config)
     parks_agg = compute_heat_vulnerability_index(parks_agg, config)
@@ -496,6 +645,7 @@ def run_analysis():
          su_w["Inv_Norm"] * (1 - parks_agg["Inv_Norm"])
     )
     
-    # Write the final geojson to output
-    parks_agg.to_file(OUTPUT_GEOJSON, driver="GeoJSON")
+    # Write the final geojson to output (pyogrio writes in bulk through
+    # GDAL instead of fiona's row-at-a-time path)
+    parks_agg.to_file(OUTPUT_GEOJSON, driver="GeoJSON", engine="pyogrio")
     print("Analysis complete. Output saved to:", OUTPUT_GEOJSON)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from types import MappingProxyType
 
 # Base directories
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,6 +27,9 @@ CRS = "EPSG:6539"
 ANALYSIS_BUFFER_FT = 2000       # buffer distance (in feet) for raster calculations
 RESOLUTION = 10                 # target raster resolution
 
+# Simplification tolerance (degrees, WGS84) for park outlines in the webmap
+WEBMAP_SIMPLIFY_TOL = 1e-5
+
 # Cutoff date for CapitalProjects (only include projects completed on/after this date)
 cutoff_date_simple = "01/01/2018"
 CUTOFF_DATE = datetime.strptime(f"{cutoff_date_simple} 12:00:00 AM", "%m/%d/%Y %I:%M:%S %p")
@@ -156,23 +160,24 @@ LEGEND_STYLES = {
     "label": "font-size: 13px;"
 }
 
-# New weight dictionaries (all weights add to 1 within each index)
-HAZARD_FACTOR_WEIGHTS = {
+# New weight dictionaries (all weights add to 1 within each index).
+# Read-only views so downstream code can't mutate them accidentally.
+HAZARD_FACTOR_WEIGHTS = MappingProxyType({
     "CoastalFloodHaz": 0.25,
     "StormFloodHaz": 0.50,
     "HeatHaz": 0.25
-}
+})
 
-VULNERABILITY_FACTOR_WEIGHTS = {
+VULNERABILITY_FACTOR_WEIGHTS = MappingProxyType({
     "HeatVuln": 0.50,
     "FloodVuln": 0.50
-}
+})
 
-SUITABILITY_WEIGHTS = {
+SUITABILITY_WEIGHTS = MappingProxyType({
     "hazard_factor": 0.25,
     "vul_factor": 0.25,
     "Inv_Norm": 0.50  # note: this will be applied inverted (1 - Inv_Norm)
-}
+})
 
 # Where your SVG icons live
 ICONS_DIR = os.path.join(INPUT_DIR, "icons")
@@ -1,4 +1,3 @@
-from analysis_modules import run_analysis
 from webmap import generate_webmap
 import os
 import webbrowser
@@ -13,6 +12,9 @@ def main():
         print(f"Analysis output file {OUTPUT_GEOJSON} already exists. Skipping analysis.")
     else:
         print("Running analysis...")
+        # Imported lazily so re-runs that reuse the cached GeoJSON skip
+        # loading the heavy raster/analysis stack entirely.
+        from analysis_modules import run_analysis
         run_analysis()
     
     # Generate the webmap
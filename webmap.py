@@ -1,16 +1,26 @@
 import os
 import re
+import glob
 import json
+import hashlib
 import folium
+import numpy as np
+import pandas as pd
 import geopandas as gpd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+import pyproj
+import shapely
 import rasterio
 from rasterio import warp
 from rasterio.enums import Resampling
 import jenkspy
 
+import config
 from config import (
     cutoff_date_simple,
     DATASET_INFO,
@@ -26,7 +36,8 @@ from config import (
     FVI_DATA,
     HVI_DATA,
     RESOLUTION,
-    LEGEND_STYLES
+    LEGEND_STYLES,
+    WEBMAP_SIMPLIFY_TOL
 )
 
 ###############################################################################
@@ -45,10 +56,13 @@ STYLE_BLOCK = """
     font-size: 20px;
     font-weight: bold;
     margin-bottom: 0.4em;
+    padding-top: 10px;
+    padding-bottom: 10px;
   }
   
   /* Bubbles (cards) */
   .info-bubble {
+    text-align: center;
     background: #f9f9f9;
     border-radius: 8px;
     padding: 10px;
@@ -71,6 +85,9 @@ STYLE_BLOCK = """
     overflow: hidden;
   }
   .collapsible summary {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
     padding: 8px;
     margin: 0;
     font-size: 14px;
@@ -91,14 +108,16 @@ STYLE_BLOCK = """
   .scrollable-table {
     max-height: 150px;
     overflow-y: auto;
+    padding: 8px;
   }
   
   /* Icon rows & columns */
   .icon-row {
     display: flex;
-    justify-content: space-evenly; 
-    align-items: center; 
+    justify-content: center;
+    align-items: center;
     gap: 10px;
+    margin-top: 10px;
   }
   .icon-col {
     display: flex;
@@ -137,36 +156,48 @@ STYLE_BLOCK = """
 ###############################################################################
 # 2. HELPER FUNCTIONS FOR COLOR & RASTER PROCESSING
 ###############################################################################
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color):
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # One int() parse plus bit shifts; cached since the same handful of
+    # config colors are converted over and over. Truncated to the first
+    # three pairs so 8-digit #RRGGBBAA ramps keep yielding (R, G, B) like
+    # the old slicing version did.
+    v = int(hex_color.lstrip('#')[:6], 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
 
 def rgb_to_hex(rgb):
     return '#{:02x}{:02x}{:02x}'.format(*rgb)
 
+@lru_cache(maxsize=32)
+def _ramp_hex_lut(start_hex, end_hex):
+    """256 precomputed hex colors along a ramp, built once per endpoint pair."""
+    start_rgb = np.array(hex_to_rgb(start_hex), dtype=float)
+    end_rgb = np.array(hex_to_rgb(end_hex), dtype=float)
+    t = np.linspace(0.0, 1.0, 256)[:, None]
+    lut = (start_rgb + (end_rgb - start_rgb) * t).astype(int)
+    return tuple('#{:02x}{:02x}{:02x}'.format(r, g, b) for r, g, b in lut)
+
 def interpolate_color(val, start_hex, end_hex):
-    import numpy as np
     if np.isnan(val):
         return start_hex
-    start_rgb = hex_to_rgb(start_hex)
-    end_rgb = hex_to_rgb(end_hex)
-    val = max(0, min(1, val))
-    interp = tuple(int(s + (e - s) * val) for s, e in zip(start_rgb, end_rgb))
-    return rgb_to_hex(interp)
+    # One LUT index instead of two hex parses, float blending, and a hex
+    # format per call; 256 levels is below visual precision anyway.
+    return _ramp_hex_lut(start_hex, end_hex)[int(max(0.0, min(1.0, val)) * 255)]
 
+@lru_cache(maxsize=256)
 def hex_to_rgba(hex_color):
     """Convert hex color to RGBA tuple, handling 8-digit hex with alpha."""
-    hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 8:  # RRGGBBAA format
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4, 6))
-    elif len(hex_color) == 6:  # RRGGBB format
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4)) + (255,)
+    s = hex_color.lstrip('#')
+    if len(s) == 8:  # RRGGBBAA format
+        v = int(s, 16)
+        return (v >> 24) & 0xFF, (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+    elif len(s) == 6:  # RRGGBB format
+        return hex_to_rgb(s) + (255,)
     else:
         raise ValueError(f"Invalid hex color: {hex_color}")
 
 def interpolate_color_with_alpha(val, start_hex, end_hex):
     """Interpolate between two colors, including alpha if present."""
-    import numpy as np
     if np.isnan(val):
         return start_hex
     
@@ -189,11 +220,7 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
     """
     from affine import Affine
     from PIL import Image
-    import numpy as np
     import traceback
-    import rasterio
-    from rasterio import warp
-    from rasterio.enums import Resampling
 
     try:
         # Verify the input file exists
@@ -201,8 +228,11 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
             print(f"ERROR: Input raster file does not exist: {input_raster}")
             raise FileNotFoundError(f"Input file not found: {input_raster}")
         
-        # Reproject the raster
-        with rasterio.open(input_raster) as src:
+        # Reproject the raster inside one tuned GDAL session: a bigger block
+        # cache for the warp, no directory scan on open, and VSI caching for
+        # any remote/VRT-backed source.
+        with rasterio.Env(GDAL_CACHEMAX=512, GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR", VSI_CACHE=True), \
+             rasterio.open(input_raster) as src:
             # Store original bounds for accurate placement
             src_bounds = src.bounds
             
@@ -271,28 +301,76 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
                 'height': height
             })
             
-            data = np.empty((src.count, height, width), dtype=src.dtypes[0])
-            
             try:
-                for i in range(1, src.count + 1):
+                nodata = src.nodata
+                read_resampling = Resampling.nearest if colormap == "flood" else Resampling.average
+
+                def _decimated_read(out_h, out_w):
+                    # Averaging a decimated window must not blend the nodata
+                    # collar into valid pixels, so when the source declares
+                    # nodata the read goes through the mask and the masked
+                    # cells are refilled with the nodata value afterwards.
+                    if nodata is not None:
+                        return src.read(1, out_shape=(out_h, out_w),
+                                        resampling=read_resampling,
+                                        masked=True).filled(nodata)
+                    return src.read(1, out_shape=(out_h, out_w),
+                                    resampling=read_resampling)
+
+                if src.crs == rasterio.crs.CRS.from_string(target_crs):
+                    # Already in the target CRS: one decimated read straight
+                    # onto the output grid, no warp at all.
+                    print("  Source already in target CRS; skipping reprojection")
+                    data = _decimated_read(height, width)
+                else:
+                    # Pre-decimate the source before warping: the PNG grid is
+                    # far coarser than the raster, and out_shape reads are
+                    # served from embedded overviews when the file has them
+                    # instead of a full-resolution scan. Discrete flood codes
+                    # use nearest so class values never blend during
+                    # decimation.
+                    scale = int(min(src.width / width, src.height / height))
+                    if scale >= 2:
+                        read_h = max(1, src.height // scale)
+                        read_w = max(1, src.width // scale)
+                    else:
+                        read_h, read_w = src.height, src.width
+                    src_transform = src.transform * src.transform.scale(
+                        src.width / read_w, src.height / read_h
+                    )
+                    small = _decimated_read(read_h, read_w)
+                    # Warping from an ndarray (unlike a Band) defaults both
+                    # nodata values to None, so pass them explicitly and
+                    # pre-fill the destination: corners of the WGS84 bbox lie
+                    # outside the warped footprint and must come out as
+                    # nodata, not uninitialized memory.
+                    if nodata is not None:
+                        data = np.full((height, width), nodata, dtype=src.dtypes[0])
+                    else:
+                        data = np.zeros((height, width), dtype=src.dtypes[0])
                     warp.reproject(
-                        source=rasterio.band(src, i),
-                        destination=data[i-1],
-                        src_transform=src.transform,
+                        source=small,
+                        destination=data,
+                        src_transform=src_transform,
                         src_crs=src.crs,
+                        src_nodata=nodata,
                         dst_transform=transform,
                         dst_crs=target_crs,
-                        resampling=Resampling.bilinear
+                        dst_nodata=nodata,
+                        resampling=Resampling.bilinear,
+                        # GDAL's warp thread pool splits the job into row
+                        # blocks; the per-pixel inverse mapping scales with
+                        # core count.
+                        num_threads=os.cpu_count()
                     )
-                nodata = src.nodata
             except Exception as e:
                 print(f"Error during reprojection: {e}")
                 traceback.print_exc()
-                data = np.zeros((src.count, height, width), dtype=np.float32)
+                data = np.zeros((height, width), dtype=np.float32)
                 nodata = None
 
-        # Use the first band for visualization
-        band = data[0]
+        # Only band 1 is ever visualized, so only band 1 was read and warped
+        band = data
         
         # Handle nodata values
         if nodata is not None:
@@ -306,6 +384,11 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
         # Compute normalization range:
         # For heat rasters, use 75th to 100th percentiles (i.e. the top 25% of values)
         # Otherwise (e.g., for continuous flood data), use 5th to 95th percentiles.
+        # Percentiles only set the display scaling, so a ~100k-pixel stride
+        # sample is statistically indistinguishable from sorting every valid
+        # pixel and far cheaper on NYC-sized rasters.
+        if valid_data.size > 200_000:
+            valid_data = valid_data[::valid_data.size // 100_000]
         if valid_data.size > 0:
             if colormap == "heat":
                 lower = np.percentile(valid_data, 75)
@@ -319,9 +402,6 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
             min_val = 0
             max_val = 1
         
-        # Create an empty RGBA array
-        rgba = np.zeros((height, width, 4), dtype=np.uint8)
-        
         # Select colormap parameters based on the colormap argument
         if colormap == "heat":
             ramp = DATASET_INFO["Webmap"]["Summer_Temperature"]["color_ramp"]
@@ -355,79 +435,76 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
             print(f"  Default colormap: {start_hex} to {end_hex}")
             layer_key = None
         
-        # Special processing for FEMA flood data
+        # The flood rasters hold discrete class codes, so each zone is painted
+        # with one boolean-mask fancy index instead of a per-pixel Python
+        # loop, and the result is written as a palette PNG: 3 palette entries
+        # (transparent background + two flood classes, with per-entry alpha
+        # in the tRNS chunk) instead of a full RGBA plane, which is several
+        # times smaller and faster to encode/decode.
+        save_kwargs = {}
         if "FEMA" in input_raster:
-            for i in range(height):
-                for j in range(width):
-                    if not valid[i, j] or band[i, j] == 0:
-                        rgba[i, j] = [0, 0, 0, 0]  # Fully transparent
-                    elif band[i, j] == 1:  # 100-year flood (1%)
-                        r, g, b = hex_to_rgb(DATASET_INFO["Webmap"]["FEMA_FloodHaz"]["hex_1pct"])
-                        alpha = int(DATASET_INFO["Webmap"]["FEMA_FloodHaz"].get("opacity", 0.6) * 255)
-                        rgba[i, j] = [r, g, b, alpha]
-                    elif band[i, j] == 2:  # 500-year flood (0.2%)
-                        r, g, b = hex_to_rgb(DATASET_INFO["Webmap"]["FEMA_FloodHaz"]["hex_0_2pct"])
-                        alpha = int(DATASET_INFO["Webmap"]["FEMA_FloodHaz"].get("opacity", 0.6) * 255)
-                        rgba[i, j] = [r, g, b, alpha]
-                    else:
-                        rgba[i, j] = [0, 0, 0, 0]
+            fema = DATASET_INFO["Webmap"]["FEMA_FloodHaz"]
+            alpha = int(fema.get("opacity", 0.6) * 255)
+            classes = np.zeros((height, width), dtype=np.uint8)
+            classes[valid & (band == 1)] = 1  # 100-year flood (1%)
+            classes[valid & (band == 2)] = 2  # 500-year flood (0.2%)
+            img = Image.fromarray(classes, mode="P")
+            img.putpalette([0, 0, 0, *hex_to_rgb(fema["hex_1pct"]), *hex_to_rgb(fema["hex_0_2pct"])])
+            save_kwargs["transparency"] = bytes([0, alpha, alpha])
         else:
             # Special handling for stormwater flood raster with discrete values
             if colormap == "flood" and "Stormwater" in input_raster:
-                for i in range(height):
-                    for j in range(width):
-                        if not valid[i, j]:
-                            rgba[i, j] = [0, 0, 0, 0]
-                        else:
-                            value = band[i, j]
-                            if value == 1:
-                                # Shallow flood: lighter color (start_hex)
-                                r, g, b = hex_to_rgb(start_hex)
-                                alpha = int(DATASET_INFO["Webmap"]["2080_Stormwater"].get("opacity", 0.6) * 255)
-                                rgba[i, j] = [r, g, b, alpha]
-                            elif value == 2:
-                                # Deep flood: darker color (end_hex)
-                                r, g, b = hex_to_rgb(end_hex)
-                                alpha = int(DATASET_INFO["Webmap"]["2080_Stormwater"].get("opacity", 0.6) * 255)
-                                rgba[i, j] = [r, g, b, alpha]
-                            else:
-                                rgba[i, j] = [0, 0, 0, 0]
+                alpha = int(DATASET_INFO["Webmap"]["2080_Stormwater"].get("opacity", 0.6) * 255)
+                classes = np.zeros((height, width), dtype=np.uint8)
+                classes[valid & (band == 1)] = 1  # shallow: lighter color
+                classes[valid & (band == 2)] = 2  # deep: darker color
+                img = Image.fromarray(classes, mode="P")
+                img.putpalette([0, 0, 0, *hex_to_rgb(start_hex), *hex_to_rgb(end_hex)])
+                save_kwargs["transparency"] = bytes([0, alpha, alpha])
             else:
-                # For continuous data (other than stormwater), normalize using min_val and max_val.
-                if max_val - min_val == 0:
-                    norm = np.zeros_like(band, dtype=float)
+                # For continuous data (other than stormwater), normalize using
+                # min_val and max_val into one preallocated float32 buffer:
+                # subtract/scale/clip all run with out= so no intermediate
+                # full-raster arrays are allocated, and where=valid leaves
+                # masked pixels at 0 (so no nan_to_num pass is needed).
+                norm = np.zeros_like(band, dtype=np.float32)
+                if max_val - min_val != 0:
+                    np.subtract(band, min_val, out=norm, where=valid)
+                    np.multiply(norm, 1.0 / (max_val - min_val), out=norm)
+                    np.clip(norm, 0.0, 1.0, out=norm)
+                # LUT-based colormap: precompute the ramp (and alpha rule) at
+                # 256 levels. The LUT index fully determines a pixel's color
+                # and alpha, so the index plane is itself the image: it is
+                # written as a palette PNG whose palette is the LUT, with
+                # per-entry alpha in the tRNS chunk — one byte per pixel
+                # instead of four RGBA planes. Invalid pixels land on entry 0,
+                # whose alpha is forced transparent.
+                levels = np.linspace(0.0, 1.0, 256)
+                idx = (norm * 255).astype(np.uint8)
+                if colormap == "heat" and has_transparency:
+                    start_c = np.array(hex_to_rgba(start_hex), dtype=float)
+                    end_c = np.array(hex_to_rgba(end_hex), dtype=float)
+                    lut = (start_c + (end_c - start_c) * levels[:, None]).astype(np.uint8)
+                    rgb_lut = lut[:, :3]
+                    alpha_lut = lut[:, 3].copy()
                 else:
-                    norm = np.zeros_like(band, dtype=float)
-                    norm[valid] = (band[valid] - min_val) / (max_val - min_val)
-                norm = np.nan_to_num(norm, nan=0.0)
-                norm = norm.clip(0, 1)
-                for i in range(height):
-                    for j in range(width):
-                        if valid[i, j]:
-                            t = norm[i, j]
-                            if colormap == "heat" and has_transparency:
-                                rgba_color = hex_to_rgba(interpolate_color_with_alpha(t, start_hex, end_hex))
-                                rgba[i, j] = rgba_color
-                            else:
-                                hex_color = interpolate_color(t, start_hex, end_hex)
-                                r, g, b = hex_to_rgb(hex_color)
-                                if layer_key:
-                                    base_opacity = DATASET_INFO["Webmap"][layer_key].get("opacity", 0.7) * 255
-                                    if colormap == "heat":
-                                        alpha = int(base_opacity * max(0.2, t)) if t > 0.05 else 0
-                                    else:
-                                        alpha = int(base_opacity * max(0.2, t)) if t > 0 else 0
-                                else:
-                                    if colormap == "heat":
-                                        alpha = int(200 * max(0.2, t)) if t > 0.05 else 0
-                                    else:
-                                        alpha = int(200 * max(0.2, t)) if t > 0 else 0
-                                rgba[i, j] = [r, g, b, alpha]
-                        else:
-                            rgba[i, j] = [0, 0, 0, 0]
-        
-        img = Image.fromarray(rgba)
-        img.save(output_png)
+                    start_c = np.array(hex_to_rgb(start_hex), dtype=float)
+                    end_c = np.array(hex_to_rgb(end_hex), dtype=float)
+                    rgb_lut = (start_c + (end_c - start_c) * levels[:, None]).astype(np.uint8)
+                    if layer_key:
+                        base_opacity = DATASET_INFO["Webmap"][layer_key].get("opacity", 0.7) * 255
+                    else:
+                        base_opacity = 200
+                    visible = levels > (0.05 if colormap == "heat" else 0)
+                    alpha_lut = np.where(visible, (base_opacity * np.maximum(0.2, levels)).astype(np.uint8), 0).astype(np.uint8)
+                alpha_lut[0] = 0
+                img = Image.fromarray(idx, mode="P")
+                img.putpalette(rgb_lut.tobytes())
+                save_kwargs["transparency"] = alpha_lut.tobytes()
+
+        # Lower deflate effort: these one-shot overlay tiles trade a slightly
+        # larger file for a several-times-faster encode.
+        img.save(output_png, optimize=False, compress_level=3, **save_kwargs)
         print(f"  Successfully saved {output_png}")
         
         if dst_bounds is None or not all(np.isfinite(b) for b in dst_bounds):
@@ -442,11 +519,11 @@ def process_raster_for_web(input_raster, output_png, target_crs="EPSG:4326", col
         print("Creating an empty PNG instead.")
         img = Image.new('RGBA', (500, 500), (0, 0, 0, 0))
         img.save(output_png)
-        print("Using NYC fallback bounds.")
-        return output_png, (-74.26, 40.49, -73.69, 40.91)
+        # None bounds signal failure so callers skip the overlay and,
+        # crucially, don't cache this placeholder as a good render.
+        return output_png, None
 
 def compute_jenks_breaks(values, n_classes):
-    import numpy as np
     # Filter out values that cannot be converted to float
     clean_values = []
     for v in values:
@@ -490,14 +567,31 @@ def get_color_from_multi_gradient(value, breaks, colors):
 ###############################################################################
 # 3. POPUP HTML & CAPITAL PROJECTS TABLE
 ###############################################################################
+PROJECT_FIELDS = ["Title", "CurrentPha", "Construc_4", "ProjectLia"]
+FIELD_ALIASES = {
+    "Title": "Project",
+    "CurrentPha": "Phase",
+    "Construc_4": "Completion",
+    "ProjectLia": "Liason"
+}
+# Static table scaffolding built once at import instead of per park.
+PROJECT_TABLE_HEADER = (
+    "<tr>" + "".join(f"<th>{FIELD_ALIASES.get(f, f)}</th>" for f in PROJECT_FIELDS) + "</tr>"
+)
+NO_PROJECTS_HTML = "<p>No recent capital projects.</p>"
+
+@lru_cache(maxsize=None)
+def _format_investment_total(raw_total):
+    """Format an EstInvTotal value with thousands separators, cached since
+    many parks share the same total (0 in particular)."""
+    try:
+        return f"{float(raw_total):,.0f}"
+    except (TypeError, ValueError):
+        return str(raw_total)
+# Leading M/D/YYYY date in Construc_4 completion timestamps.
+_CONSTRUC_4_DATE_RE = re.compile(r"^(\d{1,2}/\d{1,2}/\d{4})")
+
 def generate_capital_projects_table(properties):
-    PROJECT_FIELDS = ["Title", "CurrentPha", "Construc_4", "ProjectLia"]
-    FIELD_ALIASES = {
-        "Title": "Project",
-        "CurrentPha": "Phase",
-        "Construc_4": "Completion",
-        "ProjectLia": "Liason"
-    }
     data = {}
     for field in PROJECT_FIELDS:
         raw_val = properties.get(field, "")
@@ -507,10 +601,9 @@ def generate_capital_projects_table(properties):
             data[field] = []
     n = max((len(lst) for lst in data.values()), default=0)
     if n == 0:
-        return "<p>No recent capital projects.</p>"
-    
-    header = "<tr>" + "".join(f"<th>{FIELD_ALIASES.get(f, f)}</th>" for f in PROJECT_FIELDS) + "</tr>"
-    rows = [header]
+        return NO_PROJECTS_HTML
+
+    rows = [PROJECT_TABLE_HEADER]
     for i in range(n):
         row = "<tr>"
         for f in PROJECT_FIELDS:
@@ -520,137 +613,208 @@ def generate_capital_projects_table(properties):
         rows.append(row)
     return f"<table class='popup-table'>{''.join(rows)}</table>"
 
-def generate_feature_html(properties):
-    park_name = properties.get("signname", "Unknown Park")
-    title_html = f'<div class="popup-header" style="padding-top: 10px; padding-bottom: 10px;">{park_name}</div>'
+# (label, properties field) pairs for the hazard / vulnerability icon rows
+HAZARD_ICON_FIELDS = (
+    ("Extreme Heat", "HeatHaz"),
+    ("Coastal Flooding", "CoastalFloodHaz"),
+    ("Stormwater Flooding", "StormFloodHaz")
+)
+VULNERABILITY_ICON_FIELDS = (
+    ("Heat Vulnerability", "HeatVuln"),
+    ("Flood Vulnerability", "FloodVuln")
+)
+
+def _icon_col_html(label, opacity):
+    # Compact placeholder: only the label and opacity are per-park, so the
+    # circle/img/label skeleton is filled in client-side on popupopen (see
+    # the expandIcons script in generate_webmap) instead of being repeated
+    # in every popup string.
+    return f'<div class="icon-col" data-icon="{label}" data-op="{opacity}"></div>'
 
+# Popup scaffolding rendered once at import; generate_feature_html fills it
+# with a single .format call instead of building five nested f-strings.
+# Kept as concatenated one-line fragments: the rendered string is repeated
+# once per park in the POPUPS map, so indentation whitespace here would be
+# paid N times in the output HTML.
+_POPUP_TEMPLATE = (
+    '<div class="popup-content">'
+    '<div class="popup-header">{park_name}</div>'
+    '<div class="info-bubble">'
+    '<h4>High-Impact Investment Opportunity: <span style="color:{high_impact_color};">{suitability:.2f}</span></h4>'
+    "</div>"
+    '<div class="info-bubble">'
+    "<h4>Estimated Recent Investments:<br>${total_investment} (since {cutoff})</h4>"
+    '<div class="icon-row">{capital_icon}</div>'
+    '<details class="collapsible">'
+    "<summary>"
+    "<span>Recent Capital Projects</span>"
+    '<span style="font-weight:bold;">▼</span>'
+    "</summary>"
+    '<div class="scrollable-table">{projects_table}</div>'
+    "</details>"
+    "</div>"
+    '<div class="info-bubble">'
+    "<h4>Overall Hazard Rating: {hazard_factor:.2f}</h4>"
+    '<div class="icon-row">{hazard_icons}</div>'
+    "</div>"
+    '<div class="info-bubble">'
+    "<h4>Overall Vulnerability Rating: {vul_factor:.2f}</h4>"
+    '<div class="icon-row">{vulnerability_icons}</div>'
+    "</div>"
+    "</div>"
+)
+
+def generate_feature_html(properties):
     suitability = properties.get("suitability", 0)
-    suitability_str = f"{suitability:.2f}"
-    high_impact_color = interpolate_color(suitability, "#ff0000", "#00ff00")
-    bubble_high_impact = f"""
-    <div class="info-bubble" style="text-align:center;">
-      <h4>High-Impact Investment Opportunity: <span style="color:{high_impact_color};">{suitability_str}</span></h4>
-    </div>
-    """
+    return _POPUP_TEMPLATE.format(
+        park_name=properties.get("signname", "Unknown Park"),
+        high_impact_color=interpolate_color(suitability, "#ff0000", "#00ff00"),
+        suitability=suitability,
+        total_investment=_format_investment_total(properties.get("EstInvTotal", 0)),
+        cutoff=cutoff_date_simple,
+        capital_icon=_icon_col_html("Capital", properties.get("Inv_Norm", 0)),
+        projects_table=generate_capital_projects_table(properties),
+        hazard_factor=properties.get("hazard_factor", 0),
+        hazard_icons="".join(
+            _icon_col_html(label, properties.get(field, 0)) for label, field in HAZARD_ICON_FIELDS
+        ),
+        vul_factor=properties.get("vul_factor", 0),
+        vulnerability_icons="".join(
+            _icon_col_html(label, properties.get(field, 0)) for label, field in VULNERABILITY_ICON_FIELDS
+        ),
+    )
 
-    raw_total = properties.get("EstInvTotal", 0)
-    try:
-        total_investment = f"{float(raw_total):,.0f}"
-    except:
-        total_investment = str(raw_total)
-    
-    inv_norm_opacity = properties.get("Inv_Norm", 0)
-    bubble_investments = f"""
-    <div class="info-bubble" style="text-align:center;">
-      <h4>Estimated Recent Investments:<br>${total_investment} (since {cutoff_date_simple})</h4>
-      <div class="icon-row" style="margin-top:10px; justify-content:center;">
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Capital']}" 
-                 class="circle-icon" 
-                 style="opacity:{inv_norm_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Capital</div>
-        </div>
-      </div>
-      <details class="collapsible" style="margin-top:10px;">
-        <summary style="display:flex; justify-content: space-between; align-items:center; cursor:pointer;">
-          <span>Recent Capital Projects</span>
-          <span style="font-weight:bold;">▼</span>
-        </summary>
-        <div class="scrollable-table" style="padding:8px;">
-          {generate_capital_projects_table(properties)}
-        </div>
-      </details>
-    </div>
-    """
-    
-    hazard_factor = properties.get("hazard_factor", 0)
-    heat_opacity = properties.get("HeatHaz", 0)
-    coastal_opacity = properties.get("CoastalFloodHaz", 0)
-    storm_opacity = properties.get("StormFloodHaz", 0)
-    bubble_hazard = f"""
-    <div class="info-bubble" style="text-align:center;">
-      <h4>Overall Hazard Rating: {hazard_factor:.2f}</h4>
-      <div class="icon-row" style="margin-top:10px; justify-content:center;">
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Extreme Heat']}" 
-                 class="circle-icon" 
-                 style="opacity:{heat_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Extreme Heat</div>
-        </div>
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Coastal Flooding']}" 
-                 class="circle-icon" 
-                 style="opacity:{coastal_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Coastal Flooding</div>
-        </div>
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Stormwater Flooding']}" 
-                 class="circle-icon" 
-                 style="opacity:{storm_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Stormwater Flooding</div>
-        </div>
-      </div>
-    </div>
+def _interpolate_color_series(vals, start_hex, end_hex):
+    """Vectorized interpolate_color over an array of values in [0, 1]."""
+    start_rgb = np.array(hex_to_rgb(start_hex), dtype=float)
+    end_rgb = np.array(hex_to_rgb(end_hex), dtype=float)
+    t = np.clip(np.nan_to_num(np.asarray(vals, dtype=float), nan=0.0), 0.0, 1.0)
+    rgb = (start_rgb + (end_rgb - start_rgb) * t[:, None]).astype(int)
+    return ["#{:02x}{:02x}{:02x}".format(r, g, b) for r, g, b in rgb]
+
+def _capital_projects_tables(gdf):
+    """Build the capital-projects table HTML for every park at once.
+
+    The comma-joined project fields are split once per column with pandas
+    string ops, then the per-park tables are assembled from the precomputed
+    lists — no per-row dict copies or repeated header construction.
     """
-    
-    vul_factor = properties.get("vul_factor", 0)
-    hv_opacity = properties.get("HeatVuln", 0)
-    fv_opacity = properties.get("FloodVuln", 0)
-    bubble_vulnerability = f"""
-    <div class="info-bubble" style="text-align:center;">
-      <h4>Overall Vulnerability Rating: {vul_factor:.2f}</h4>
-      <div class="icon-row" style="margin-top:10px; justify-content:center;">
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Heat Vulnerability']}" 
-                 class="circle-icon" 
-                 style="opacity:{hv_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Heat Vulnerability</div>
-        </div>
-        <div class="icon-col">
-          <div class="circle-bg">
-            <img src="{ICONS_DIR}/{INDEX_ICONS['Flood Vulnerability']}" 
-                 class="circle-icon" 
-                 style="opacity:{fv_opacity};" />
-            <img src="{OUTLINE_SVG}" class="icon-outline" style="opacity:1;" />
-          </div>
-          <div class="icon-label">Flood Vulnerability</div>
-        </div>
-      </div>
-    </div>
+    columns = []
+    for f in PROJECT_FIELDS:
+        col = gdf[f] if f in gdf.columns else pd.Series("", index=gdf.index)
+        col = col.where(col.map(lambda v: isinstance(v, str)), "")
+        lists = col.str.split(",").map(lambda lst: [v.strip() for v in lst if v.strip()])
+        if f == "Construc_4":
+            # The display only needs the leading M/D/YYYY of each completion
+            # timestamp, so grab it with one vectorized regex extract — no
+            # datetime round-trip at all. Tokens that are not dates pass
+            # through unchanged.
+            exploded = lists.explode()
+            dates = exploded.str.extract(_CONSTRUC_4_DATE_RE, expand=False)
+            lists = dates.fillna(exploded).groupby(level=0).agg(list)
+            lists = lists.map(lambda lst: [v for v in lst if isinstance(v, str)])
+        columns.append(lists.tolist())
+    tables = []
+    for row_lists in zip(*columns):
+        n = max((len(lst) for lst in row_lists), default=0)
+        if n == 0:
+            tables.append(NO_PROJECTS_HTML)
+            continue
+        rows = [PROJECT_TABLE_HEADER]
+        for i in range(n):
+            rows.append("<tr>" + "".join(f"<td>{lst[i] if i < len(lst) else ''}</td>" for lst in row_lists) + "</tr>")
+        tables.append(f"<table class='popup-table'>{''.join(rows)}</table>")
+    return tables
+
+def build_popup_html_column(gdf):
     """
-    
-    return f"""
-    <div class="popup-content">
-      {title_html}
-      {bubble_high_impact}
-      {bubble_investments}
-      {bubble_hazard}
-      {bubble_vulnerability}
-    </div>
+    Column-wise replacement for per-row generate_feature_html: every dynamic
+    piece (names, ratings, colors, icon opacities, project tables) is computed
+    as a whole Series, then the popup HTML is assembled with bulk string
+    concatenation instead of one Python f-string call per park.
     """
+    idx = gdf.index
+
+    def _numeric(col):
+        if col in gdf.columns:
+            return pd.to_numeric(gdf[col], errors="coerce").fillna(0.0)
+        return pd.Series(0.0, index=idx)
+
+    def _icon_col(label, opacity):
+        # Same compact placeholder as _icon_col_html, expanded client-side.
+        return (
+            f'<div class="icon-col" data-icon="{label}" data-op="'
+            + opacity.astype(str) + '"></div>'
+        )
+
+    def _icon_cols(label_fields):
+        parts = [_icon_col(label, _numeric(field)) for label, field in label_fields]
+        out = parts[0]
+        for part in parts[1:]:
+            out = out + part
+        return out
+
+    if "signname" in gdf.columns:
+        names = gdf["signname"].fillna("Unknown Park").astype(str)
+    else:
+        names = pd.Series("Unknown Park", index=idx)
+    title_html = '<div class="popup-header">' + names + "</div>"
+
+    suit = _numeric("suitability")
+    suit_color = pd.Series(_interpolate_color_series(suit.to_numpy(), "#ff0000", "#00ff00"), index=idx)
+    bubble_high_impact = (
+        '<div class="info-bubble">'
+        '<h4>High-Impact Investment Opportunity: <span style="color:'
+        + suit_color + ';">' + suit.map("{:.2f}".format) + "</span></h4></div>"
+    )
+
+    raw_total = gdf["EstInvTotal"] if "EstInvTotal" in gdf.columns else pd.Series(0, index=idx)
+    total_num = pd.to_numeric(raw_total, errors="coerce")
+    total_fmt = total_num.map("{:,.0f}".format, na_action="ignore").where(total_num.notna(), raw_total.astype(str))
+    tables = pd.Series(_capital_projects_tables(gdf), index=idx)
+    bubble_investments = (
+        '<div class="info-bubble">'
+        "<h4>Estimated Recent Investments:<br>$" + total_fmt + f" (since {cutoff_date_simple})</h4>"
+        '<div class="icon-row">'
+        + _icon_col("Capital", _numeric("Inv_Norm")) +
+        "</div>"
+        '<details class="collapsible">'
+        "<summary>"
+        '<span>Recent Capital Projects</span><span style="font-weight:bold;">▼</span></summary>'
+        '<div class="scrollable-table">' + tables + "</div></details></div>"
+    )
+
+    bubble_hazard = (
+        '<div class="info-bubble">'
+        "<h4>Overall Hazard Rating: " + _numeric("hazard_factor").map("{:.2f}".format) + "</h4>"
+        '<div class="icon-row">'
+        + _icon_cols(HAZARD_ICON_FIELDS)
+        + "</div></div>"
+    )
+
+    bubble_vulnerability = (
+        '<div class="info-bubble">'
+        "<h4>Overall Vulnerability Rating: " + _numeric("vul_factor").map("{:.2f}".format) + "</h4>"
+        '<div class="icon-row">'
+        + _icon_cols(VULNERABILITY_ICON_FIELDS)
+        + "</div></div>"
+    )
+
+    return (
+        '<div class="popup-content">'
+        + title_html + bubble_high_impact + bubble_investments
+        + bubble_hazard + bubble_vulnerability + "</div>"
+    )
 
 ###############################################################################
 # 4. STYLE FUNCTION FOR PARKS (BY SUITABILITY)
 ###############################################################################
-def style_function(feature):
-    suitability = feature['properties'].get("suitability", 0)
-    ramp = DATASET_INFO["Webmap"]["Suitability"]["color_ramp"]
-    fill_color = interpolate_color(suitability, ramp["start"], ramp["end"])
+# Looked up once; style_function runs per feature.
+_SUITABILITY_RAMP = DATASET_INFO["Webmap"]["Suitability"]["color_ramp"]
+
+@lru_cache(maxsize=256)
+def _parks_style(quantized):
+    fill_color = interpolate_color(quantized / 255.0, _SUITABILITY_RAMP["start"], _SUITABILITY_RAMP["end"])
     return {
         "fillColor": fill_color,
         "color": fill_color,
@@ -658,68 +822,182 @@ def style_function(feature):
         "fillOpacity": 0.6,
     }
 
+def style_function(feature):
+    # Quantize suitability to 1/255 steps so the style dicts are shared from
+    # a small cache instead of allocated (plus a color interpolation) per
+    # feature; folium only reads them.
+    suitability = feature['properties'].get("suitability", 0)
+    try:
+        quantized = int(max(0.0, min(1.0, float(suitability))) * 255)
+    except (TypeError, ValueError):
+        quantized = 0
+    return _parks_style(quantized)
+
+@lru_cache(maxsize=None)
+def _wgs84_transformer(src_crs_wkt):
+    return pyproj.Transformer.from_crs(src_crs_wkt, "EPSG:4326", always_xy=True)
+
+def _to_wgs84(gdf):
+    """
+    Reproject a GeoDataFrame to EPSG:4326 through a module-cached pyproj
+    Transformer applied to the raw coordinate buffer (shapely 2.x
+    get/set_coordinates), so repeated generate_webmap calls skip the
+    Transformer construction gdf.to_crs pays each time. Falls back to
+    gdf.to_crs for anything unusual.
+    """
+    try:
+        if gdf.crs is not None and gdf.crs.to_epsg() == 4326:
+            return gdf
+        transformer = _wgs84_transformer(gdf.crs.to_wkt())
+        geoms = np.array(gdf.geometry.values, dtype=object)
+        coords = shapely.get_coordinates(geoms)
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        geoms = shapely.set_coordinates(geoms, np.column_stack([x, y]))
+        out = gdf.copy()
+        out["geometry"] = geoms
+        return out.set_crs(4326, allow_override=True)
+    except Exception:
+        return gdf.to_crs(epsg=4326)
+
+def _gdf_to_geojson(gdf):
+    """
+    Convert a GeoDataFrame to a GeoJSON FeatureCollection dict with shapely's
+    vectorized geometry encoder and orjson, instead of gdf.to_json()'s
+    per-feature Python mapping. Returned as a dict rather than a string so
+    folium.GeoJson embeds it directly instead of json.loads-ing it back.
+    NaN properties are emitted as null, matching to_json().
+    """
+    geoms = shapely.to_geojson(gdf.geometry.values)
+    props_df = gdf.drop(columns="geometry")
+    props_df = props_df.where(pd.notna(props_df), None)
+    features = [
+        {"type": "Feature", "properties": p, "geometry": orjson.loads(g)}
+        for p, g in zip(props_df.to_dict("records"), geoms)
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
 ###############################################################################
 # 5. MAIN WEBMAP GENERATION
 ###############################################################################
+def _raster_png_path(source, web_dir, stem):
+    """Cache filename for a layer, keyed by the mtimes of the source file
+    and config.py (the ramps/opacities baked into the pixels live there)
+    so unchanged inputs are reused and edits never serve stale tiles."""
+    key = hashlib.md5(
+        f"{os.path.getmtime(source)}:{os.path.getmtime(config.__file__)}:{RESOLUTION}".encode()
+    ).hexdigest()[:8]
+    return os.path.join(web_dir, f"{stem}_{key}.png")
+
+def _process_raster_layers(specs, web_dir):
+    """
+    Resolve each (source, stem, colormap) layer to (png_path, bounds).
+    Cache hits are read from the sidecar JSON; misses are regenerated in a
+    small thread pool — the three pipelines are independent and spend their
+    time in rasterio/PIL C code that releases the GIL, so they finish in the
+    wall time of the slowest instead of their sum, with no worker-process
+    spawn or pickling cost.
+    """
+    layers = {}
+    pending = []
+    for source, stem, colormap in specs:
+        if not os.path.exists(source):
+            print(f"WARNING: Raster file does not exist at {source}")
+            layers[stem] = (None, None)
+            continue
+        png_path = _raster_png_path(source, web_dir, stem)
+        meta_path = png_path + ".json"
+        if os.path.exists(png_path) and os.path.exists(meta_path):
+            with open(meta_path) as f:
+                layers[stem] = (png_path, tuple(json.load(f)))
+            continue
+        for stale in glob.glob(os.path.join(web_dir, f"{stem}_*.png")):
+            for path in (stale, stale + ".json"):
+                if os.path.exists(path):
+                    os.remove(path)
+        print(f"Processing {stem} raster from {source}")
+        pending.append((source, stem, colormap, png_path))
+    if pending:
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {
+                stem: pool.submit(process_raster_for_web, source, png_path,
+                                  target_crs="EPSG:4326", colormap=colormap)
+                for source, stem, colormap, png_path in pending
+            }
+            for stem, future in futures.items():
+                png_path, bounds = future.result()
+                if bounds is None:
+                    # Failed render: no sidecar, so the next run retries
+                    # instead of serving the blank placeholder from cache.
+                    layers[stem] = (png_path, None)
+                    continue
+                with open(png_path + ".json", "w") as f:
+                    json.dump(list(bounds), f)
+                layers[stem] = (png_path, bounds)
+    return layers
+
+def _webmap_cache_key():
+    """Content key over everything the webmap is built from: the input
+    rasters, the analysis GeoJSON, the vector overlays, the icons
+    directory, and this module plus config (so code, ramp, legend, and
+    weight changes invalidate the cached HTML)."""
+    h = hashlib.sha1()
+    for path in (HEAT_FILE, FEMA_RASTER, STORM_RASTER, OUTPUT_GEOJSON,
+                 HVI_DATA, FVI_DATA, ICONS_DIR, __file__, config.__file__):
+        try:
+            st = os.stat(path)
+            h.update(f"{path}:{st.st_mtime_ns}:{st.st_size};".encode())
+        except OSError:
+            h.update(f"{path}:missing;".encode())
+    return h.hexdigest()
+
 def generate_webmap():
-    import shutil
+    # The fastest build is the one that is skipped: if none of the inputs
+    # (or this module) changed since the last run, the existing HTML is
+    # already correct.
+    cache_key = _webmap_cache_key()
+    key_path = OUTPUT_WEBMAP + ".cachekey"
+    if os.path.exists(OUTPUT_WEBMAP) and os.path.exists(key_path):
+        with open(key_path) as f:
+            if f.read().strip() == cache_key:
+                print(f"Webmap up to date ({OUTPUT_WEBMAP}); skipping rebuild.")
+                return
+
+    # Create directory for processed web layers
     web_dir = os.path.join(OUTPUT_DIR, "web_layers")
-    if os.path.exists(web_dir):
-        shutil.rmtree(web_dir)
     os.makedirs(web_dir, exist_ok=True)
 
     m = folium.Map(location=[40.7128, -74.0060], zoom_start=10, tiles='CartoDB Positron')
     m.get_root().html.add_child(folium.Element(STYLE_BLOCK))
-    
-    # Create directory for processed web layers
-    web_dir = os.path.join(OUTPUT_DIR, "web_layers")
-    os.makedirs(web_dir, exist_ok=True)
-    
-    # Process and cache raster layers
-    heat_png = os.path.join(web_dir, "heat.png")
-    heat_bounds = None
-    if not os.path.exists(heat_png):
-        if os.path.exists(HEAT_FILE):
-            print(f"Processing heat raster from {HEAT_FILE}")
-            heat_png, heat_bounds = process_raster_for_web(HEAT_FILE, heat_png, target_crs="EPSG:4326", colormap="heat")
-        else:
-            print(f"WARNING: Heat raster file does not exist at {HEAT_FILE}")
-
-    fema_png = os.path.join(web_dir, "fema.png")
-    fema_bounds = None
-    if not os.path.exists(fema_png):
-        if os.path.exists(FEMA_RASTER):
-            print(f"Processing FEMA raster from {FEMA_RASTER}")
-            fema_png, fema_bounds = process_raster_for_web(FEMA_RASTER, fema_png, target_crs="EPSG:4326", colormap="flood")
-        else:
-            print(f"WARNING: FEMA raster file does not exist at {FEMA_RASTER}")
-
-    storm_png = os.path.join(web_dir, "storm.png")
-    storm_bounds = None
-    if not os.path.exists(storm_png):
-        if os.path.exists(STORM_RASTER):
-            print(f"Processing storm raster from {STORM_RASTER}")
-            storm_png, storm_bounds = process_raster_for_web(STORM_RASTER, storm_png, target_crs="EPSG:4326", colormap="flood")
-        else:
-            print(f"WARNING: Storm raster file does not exist at {STORM_RASTER}")
+
+    # Process (or reuse) the cached raster overlays
+    layers = _process_raster_layers((
+        (HEAT_FILE, "heat", "heat"),
+        (FEMA_RASTER, "fema", "flood"),
+        (STORM_RASTER, "storm", "flood"),
+    ), web_dir)
+    heat_png, heat_bounds = layers["heat"]
+    fema_png, fema_bounds = layers["fema"]
+    storm_png, storm_bounds = layers["storm"]
 
     # --- Vulnerability Layers Integration ---
 
     # Add Heat Vulnerability (HVI) layer
     if os.path.exists(HVI_DATA):
-        hvi_gdf = gpd.read_file(HVI_DATA).to_crs(epsg=4326)
+        hvi_gdf = _to_wgs84(gpd.read_file(HVI_DATA, engine="pyogrio"))
+        # Map values 1-5 to a color using the provided 5-class color ramp;
+        # config lookups hoisted out of the per-feature closure.
+        hvi_colors = DATASET_INFO["HVI"]["color_ramp"]["colors"]
+        hvi_opacity = DATASET_INFO["HVI"].get("opacity", 0.3)
         def style_hvi(feature):
             try:
                 val = float(feature['properties'].get("HVI", 1))
             except:
                 val = 1
-            # Map values 1-5 to a color using the provided 5-class color ramp.
-            colors = DATASET_INFO["HVI"]["color_ramp"]["colors"]
-            idx = min(max(int(round(val)) - 1, 0), len(colors) - 1)
-            return {"fillColor": colors[idx],
-                    "color": colors[idx],
+            idx = min(max(int(round(val)) - 1, 0), len(hvi_colors) - 1)
+            return {"fillColor": hvi_colors[idx],
+                    "color": hvi_colors[idx],
                     "weight": 1,
-                    "fillOpacity": DATASET_INFO["HVI"].get("opacity", 0.3)}
+                    "fillOpacity": hvi_opacity}
         folium.GeoJson(
              hvi_gdf,
              name=DATASET_INFO["HVI"]["name"],
@@ -733,19 +1011,22 @@ def generate_webmap():
 
     # Add Flood Vulnerability layers from FVI_DATA
     if os.path.exists(FVI_DATA):
-        fvi_gdf = gpd.read_file(FVI_DATA).to_crs(epsg=4326)
+        fvi_gdf = _to_wgs84(gpd.read_file(FVI_DATA, engine="pyogrio"))
         # Flood Vulnerability – SS layer
+        # For a discrete mapping, use the "start" color for lower values and
+        # "end" for higher values; ramp lookups hoisted out of the closure.
+        ss_ramp = DATASET_INFO["Flood_Vulnerability_SS"]["color_ramp"]
+        ss_opacity = DATASET_INFO["Flood_Vulnerability_SS"].get("opacity", 0.15)
         def style_fvi_ss(feature):
             try:
                 val = float(feature['properties'].get("ss_80s", 1))
             except:
                 val = 1
-            # For a discrete mapping, use the "start" color for lower values and "end" for higher values.
-            color = DATASET_INFO["Flood_Vulnerability_SS"]["color_ramp"]["start"] if val <= 3 else DATASET_INFO["Flood_Vulnerability_SS"]["color_ramp"]["end"]
+            color = ss_ramp["start"] if val <= 3 else ss_ramp["end"]
             return {"fillColor": color,
                     "color": color,
                     "weight": 1,
-                    "fillOpacity": DATASET_INFO["Flood_Vulnerability_SS"].get("opacity", 0.15)}
+                    "fillOpacity": ss_opacity}
         folium.GeoJson(
              fvi_gdf,
              name=DATASET_INFO["Flood_Vulnerability_SS"]["name"],
@@ -755,16 +1036,18 @@ def generate_webmap():
              show=False
         ).add_to(m)
         # Flood Vulnerability – TID layer
+        tid_ramp = DATASET_INFO["Flood_Vulnerability_TID"]["color_ramp"]
+        tid_opacity = DATASET_INFO["Flood_Vulnerability_TID"].get("opacity", 0.15)
         def style_fvi_tid(feature):
             try:
                 val = float(feature['properties'].get("tid_80s", 1))
             except:
                 val = 1
-            color = DATASET_INFO["Flood_Vulnerability_TID"]["color_ramp"]["start"] if val <= 3 else DATASET_INFO["Flood_Vulnerability_TID"]["color_ramp"]["end"]
+            color = tid_ramp["start"] if val <= 3 else tid_ramp["end"]
             return {"fillColor": color,
                     "color": color,
                     "weight": 1,
-                    "fillOpacity": DATASET_INFO["Flood_Vulnerability_TID"].get("opacity", 0.15)}
+                    "fillOpacity": tid_opacity}
         folium.GeoJson(
              fvi_gdf,
              name=DATASET_INFO["Flood_Vulnerability_TID"]["name"],
@@ -777,10 +1060,20 @@ def generate_webmap():
         print("WARNING: FVI data not found.")
 
     # Load Parks GeoJSON but don't add it yet
-    gdf = gpd.read_file(OUTPUT_GEOJSON)
-    gdf = gdf.to_crs(epsg=4326)
-    gdf["popup_html"] = gdf.apply(lambda row: generate_feature_html(row.to_dict()), axis=1)
-    geojson_data = gdf.to_json()
+    gdf = gpd.read_file(OUTPUT_GEOJSON, engine="pyogrio")
+    gdf = _to_wgs84(gdf)
+    # Thin the park outlines before serialization; at webmap zoom levels the
+    # tolerance is imperceptible but cuts the embedded vertex count hard.
+    # Snapping to a 1e-6 degree grid (~10 cm) afterwards keeps the serialized
+    # coordinates short instead of 15-digit doubles.
+    gdf["geometry"] = shapely.simplify(gdf.geometry.values, tolerance=WEBMAP_SIMPLIFY_TOL, preserve_topology=True)
+    gdf["geometry"] = shapely.set_precision(gdf.geometry.values, 1e-6)
+    # Popups live in one POPUPS JS object keyed by park id rather than being
+    # embedded (and iframe-parsed) inside every feature's properties; each
+    # feature only carries the key, the style input, and its geometry.
+    popup_map = dict(zip(gdf.index.astype(str), build_popup_html_column(gdf)))
+    gdf["pid"] = gdf.index.astype(str)
+    geojson_data = _gdf_to_geojson(gdf[["geometry", "pid", "suitability"]])
 
     # Get bounds for overlay alignment
     bounds = gdf.total_bounds  # [minx, miny, maxx, maxy]
@@ -833,25 +1126,53 @@ def generate_webmap():
         print("WARNING: No valid bounds for storm overlay. Layer will not be added.")
     
     # Now add the Parks layer LAST so it's on top
-    popup = folium.GeoJsonPopup(
-        fields=["popup_html"],
-        aliases=[None],
-        labels=False,
-        parse_html=True
-    )
-    
     # Add parks layer with a higher z-index to ensure it's on top
-    folium.GeoJson(
+    parks_layer = folium.GeoJson(
         data=geojson_data,
         name="NYC Parks",
         style_function=style_function,
-        popup=popup,
         overlay=True,
         control=True,
         show=True,
         highlight_function=lambda x: {'weight': 3, 'fillOpacity': 0.8}  # Enhance highlight effect
-    ).add_to(m)
-    
+    )
+    parks_layer.add_to(m)
+
+    # Inject the popup map once and bind per feature, instead of
+    # GeoJsonPopup's per-feature iframe parsing of an embedded HTML field.
+    # The icon columns ship as placeholders (data-icon/data-op) and are
+    # expanded from one shared skeleton when a popup opens, so the markup
+    # is not duplicated across every popup string.
+    icon_srcs = {label: f"{ICONS_DIR}/{fname}" for label, fname in INDEX_ICONS.items()}
+    popup_script = (
+        "<script>\n"
+        "var POPUPS = " + orjson.dumps(popup_map).decode() + ";\n"
+        "var ICON_SRCS = " + orjson.dumps(icon_srcs).decode() + ";\n"
+        f"var OUTLINE_SRC = {json.dumps(OUTLINE_SVG)};\n"
+        "function expandIcons(root) {\n"
+        "    if (!root) return;\n"
+        "    root.querySelectorAll('.icon-col[data-icon]').forEach(function(el) {\n"
+        "        if (el.firstChild) return;\n"
+        "        var label = el.dataset.icon;\n"
+        "        el.innerHTML = '<div class=\"circle-bg\">'\n"
+        "            + '<img src=\"' + ICON_SRCS[label] + '\" class=\"circle-icon\" style=\"opacity:' + el.dataset.op + ';\" />'\n"
+        "            + '<img src=\"' + OUTLINE_SRC + '\" class=\"icon-outline\" style=\"opacity:1;\" />'\n"
+        "            + '</div><div class=\"icon-label\">' + label + '</div>';\n"
+        "    });\n"
+        "}\n"
+        "document.addEventListener('DOMContentLoaded', function() {\n"
+        f"    {parks_layer.get_name()}.eachLayer(function(layer) {{\n"
+        "        layer.bindPopup(POPUPS[layer.feature.properties.pid]);\n"
+        "    });\n"
+        f"    {m.get_name()}.on('popupopen', function(e) {{\n"
+        "        expandIcons(e.popup.getElement());\n"
+        "    });\n"
+        "});\n"
+        "</script>"
+    )
+    m.get_root().html.add_child(folium.Element(popup_script))
+
+
     # Add layer control
     folium.LayerControl().add_to(m)
     
@@ -1025,7 +1346,13 @@ def generate_webmap():
 
     m.get_root().html.add_child(folium.Element(legend_html + legend_script))
     
-    m.save(OUTPUT_WEBMAP)
+    # Render once and write with a large buffer; the embedded GeoJSON makes
+    # this a many-MB file and m.save writes it through small chunks.
+    html = m.get_root().render()
+    with open(OUTPUT_WEBMAP, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(html)
+    with open(key_path, "w") as f:
+        f.write(cache_key)
     print("Webmap generated and saved to:", OUTPUT_WEBMAP)
 
 if __name__ == "__main__":